@@ -1,15 +1,22 @@
 """Module for handling the Amazon service"""
-import base64
-import hashlib
+import concurrent.futures
+import contextlib
+import functools
 import json
 import lzma
+import mmap
 import os
+import re
 import secrets
 import struct
 import time
 import uuid
+from base64 import urlsafe_b64encode
 from gettext import gettext as _
-from urllib.parse import parse_qs, urlencode, urlparse
+from hashlib import sha256
+from urllib.parse import quote_plus, unquote_plus, urlencode
+
+import requests
 
 from lutris import settings
 from lutris.exceptions import AuthenticationError, UnavailableGameError
@@ -18,10 +25,73 @@ from lutris.services.service_game import ServiceGame
 from lutris.services.service_media import ServiceMedia
 from lutris.util import system
 from lutris.util.amazon.sds_proto2 import CompressionAlgorithm, HashAlgorithm, Manifest, ManifestHeader
-from lutris.util.http import HTTPError, Request
+from lutris.util.http import DEFAULT_TIMEOUT, HTTPError, Request
 from lutris.util.log import logger
 from lutris.util.strings import slugify
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Library caches smaller than this are read normally rather than memory-mapped
+MMAP_MIN_SIZE = 64 * 1024
+
+AUTH_CODE_RE = re.compile(r"[?&]openid\.oa2\.authorization_code=([^&#]+)")
+
+
+def _json_loads(data):
+    """Decode JSON from bytes, using orjson when available"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def get_auth_code(url):
+    """Return the authorization code from an Amazon sign-in redirect URL,
+    or None if the URL doesn't carry one"""
+    match = AUTH_CODE_RE.search(url)
+    if not match:
+        return None
+    return unquote_plus(match.group(1))
+
+
+def _response_json(response):
+    """Decode the JSON body of a response, an empty body gives an empty dict
+    as with lutris.util.http.Request.json"""
+    if not response.content:
+        return {}
+    return _json_loads(response.content)
+
+
+def _json_dumps(obj):
+    """Encode an object to compact UTF-8 JSON bytes, using orjson when available.
+    The fallback produces the same output as orjson."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _atomic_write_bytes(path, data):
+    """Write data to path through a temporary file so that an interrupted
+    write never leaves a truncated file behind"""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as tmp_file:
+            tmp_file.write(data)
+    except Exception:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+@functools.lru_cache(None)
+def get_device_serial():
+    """Return the hardware address of this machine as 32 uppercase hex digits.
+    Looking it up can scan the network interfaces, so it is done once."""
+    return f"{uuid.getnode():032X}"
+
 
 class AmazonBanner(ServiceMedia):
     """Game logo"""
@@ -41,14 +111,27 @@ class AmazonGame(ServiceGame):
     """Representation of a Amazon game"""
     service = "amazon"
 
+    @property
+    def details(self):
+        """The API info serialized to JSON, encoded only when first needed"""
+        if self._details is None and self._details_obj is not None:
+            self._details = _json_dumps(self._details_obj).decode()
+        return self._details
+
+    @details.setter
+    def details(self, value):
+        self._details = value
+        self._details_obj = None
+
     @classmethod
     def new_from_amazon_game(cls, amazon_game):
         """Return a Amazon game instance from the API info"""
+        title = amazon_game["product"]["title"]
         service_game = AmazonGame()
         service_game.appid = str(amazon_game["id"])
-        service_game.slug = slugify(amazon_game["product"]["title"])
-        service_game.name = amazon_game["product"]["title"]
-        service_game.details = json.dumps(amazon_game)
+        service_game.slug = slugify(title)
+        service_game.name = title
+        service_game._details_obj = amazon_game
         return service_game
 
 
@@ -81,14 +164,76 @@ class AmazonService(OnlineService):
 
     redirect_uri = "https://www.amazon.com/?"
 
+    # Invariant parts of the sign-in URL, login_url only fills in the
+    # client id and the code challenge
+    login_url_head = "https://amazon.com/ap/signin?" + urlencode({
+        "openid.ns": "http://specs.openid.net/auth/2.0",
+        "openid.claimed_id": "http://specs.openid.net/auth/2.0/identifier_select",
+        "openid.identity": "http://specs.openid.net/auth/2.0/identifier_select",
+        "openid.mode": "checkid_setup",
+        "openid.oa2.scope": "device_auth_access",
+        "openid.ns.oa2": "http://www.amazon.com/ap/ext/oauth/2",
+        "openid.oa2.response_type": "code",
+        "openid.oa2.code_challenge_method": "S256",
+    })
+    login_url_tail = urlencode({
+        "language": "en_US",
+        "marketPlaceId": marketplace_id,
+        "openid.return_to": "https://www.amazon.com",
+        "openid.pape.max_auth_age": 0,
+        "openid.assoc_handle": "amzn_sonic_games_launcher",
+        "pageId": "amzn_sonic_games_launcher",
+    })
+
+    # Static part of the device registration payload, the fields set to None
+    # in auth_data and registration_data are filled in by register_device
+    device_registration_data = {
+        "auth_data": {
+            "authorization_code": None,
+            "client_domain": "DeviceLegacy",
+            "client_id": None,
+            "code_algorithm": "SHA-256",
+            "code_verifier": None,
+            "use_global_authentication": False,
+        },
+        "registration_data": {
+            "app_name": "AGSLauncher for Windows",
+            "app_version": "1.0.0",
+            "device_model": "Windows",
+            "device_name": None,
+            "device_serial": None,
+            "device_type": "A2UMVHOX7UP4V7",
+            "domain": "Device",
+            "os_version": "10.0.19044.0",
+        },
+        "requested_extensions": ["customer_info", "device_info"],
+        "requested_token_type": ["bearer", "mac_dms"],
+        "user_context_map": {},
+    }
+
     cookies_path = os.path.join(settings.CACHE_DIR, ".amazon.auth")
     user_path = os.path.join(settings.CACHE_DIR, ".amazon.user")
     cache_path = os.path.join(settings.CACHE_DIR, "amazon-library.json")
 
     locale = "en-US"
 
+    # Seconds during which a successful connection check is trusted
+    connection_check_ttl = 60
+
     is_loading = False
 
+    def __init__(self):
+        super().__init__()
+        self._user_data_cache = None
+        self._user_data_mtime = 0
+        self._library_cache = None
+        self._library_cache_mtime = 0
+        self._hardware_hash_cache = {}
+        # Keep-alive session shared by the calls to the Amazon APIs
+        self.session = requests.session()
+        self.session.headers["User-Agent"] = self.user_agent
+        self._connected_until = 0
+
     @property
     def credential_files(self):
         return [self.user_path, self.cookies_path]
@@ -96,43 +241,24 @@ class AmazonService(OnlineService):
     @property
     def login_url(self):
         """Return authentication URL"""
-        self.verifier = self.generate_code_verifier()
-        challenge = self.generate_challange(self.verifier)
+        self.verifier, challenge = self.generate_pkce()
 
         self.serial = self.generate_device_serial()
         self.client_id = self.generate_client_id(self.serial)
 
-        arguments = {
-            "openid.ns": "http://specs.openid.net/auth/2.0",
-            "openid.claimed_id": "http://specs.openid.net/auth/2.0/identifier_select",
-            "openid.identity": "http://specs.openid.net/auth/2.0/identifier_select",
-            "openid.mode": "checkid_setup",
-            "openid.oa2.scope": "device_auth_access",
-            "openid.ns.oa2": "http://www.amazon.com/ap/ext/oauth/2",
-            "openid.oa2.response_type": "code",
-            "openid.oa2.code_challenge_method": "S256",
-            "openid.oa2.client_id": f"device:{self.client_id}",
-            "language": "en_US",
-            "marketPlaceId": self.marketplace_id,
-            "openid.return_to": "https://www.amazon.com",
-            "openid.pape.max_auth_age": 0,
-            "openid.assoc_handle": "amzn_sonic_games_launcher",
-            "pageId": "amzn_sonic_games_launcher",
-            "openid.oa2.code_challenge": challenge,
-        }
-
-        return "https://amazon.com/ap/signin?" + urlencode(arguments)
+        return (
+            f"{self.login_url_head}"
+            f"&openid.oa2.client_id={quote_plus('device:' + self.client_id)}"
+            f"&{self.login_url_tail}"
+            f"&openid.oa2.code_challenge={quote_plus(challenge)}"
+        )
 
     def login_callback(self, url):
         """Get authentication token from Amazon"""
-        if url.find("openid.oa2.authorization_code") > 0:
+        auth_code = get_auth_code(url)
+        if auth_code:
             logger.info("Got authorization code")
 
-            # Parse auth code
-            parsed = urlparse(url)
-            query = parse_qs(parsed.query)
-            auth_code = query["openid.oa2.authorization_code"][0]
-
             user_data = self.register_device(auth_code)
             user_data["token_obtain_time"] = time.time()
 
@@ -140,12 +266,28 @@ class AmazonService(OnlineService):
 
             self.emit("service-login")
 
+    def logout(self):
+        """Disconnect from Amazon and forget the cached user data"""
+        self._user_data_cache = None
+        self._connected_until = 0
+        self.session.close()
+        super().logout()
+
     def is_connected(self):
         """Return whether the user is authenticated and if the service is available"""
         if not self.is_authenticated():
             return False
 
-        return self.check_connection()
+        now = time.monotonic()
+        if now < self._connected_until:
+            return True
+
+        if not self.check_connection():
+            self._connected_until = 0
+            return False
+
+        self._connected_until = now + self.connection_check_ttl
+        return True
 
     def load(self):
         """Load the user game library from the Amazon API"""
@@ -157,9 +299,7 @@ class AmazonService(OnlineService):
             return
         self.is_loading = True
         try:
-            games = [AmazonGame.new_from_amazon_game(game) for game in self.get_library()]
-            for game in games:
-                game.save()
+            games = [self.save_game(game) for game in self.get_library()]
         except:
             logger.error("Unable to get games library")
             games = None
@@ -167,37 +307,55 @@ class AmazonService(OnlineService):
         self.is_loading = False
         return games
 
+    @staticmethod
+    def save_game(amazon_game):
+        """Save a game from the API info to the database and return it"""
+        game = AmazonGame.new_from_amazon_game(amazon_game)
+        game.save()
+        return game
+
     def save_user_data(self, user_data):
         """Save the user data file"""
-        with open(self.user_path, "w", encoding='utf-8') as user_file:
-            user_file.write(json.dumps(user_data))
+        _atomic_write_bytes(self.user_path, _json_dumps(user_data))
+        self._user_data_cache = user_data
+        self._user_data_mtime = os.stat(self.user_path).st_mtime
 
     def load_user_data(self):
-        """Load the user data file"""
-        user_data = None
+        """Load the user data file, the parsed content is kept in memory for as
+        long as the file isn't modified, other service instances may update it"""
+        try:
+            mtime = os.stat(self.user_path).st_mtime
+        except FileNotFoundError as ex:
+            self._user_data_cache = None
+            raise AuthenticationError(_("No Amazon user data available, please log in again")) from ex
 
-        if not os.path.exists(self.user_path):
-            raise AuthenticationError(_("No Amazon user data available, please log in again"))
+        if self._user_data_cache is not None and mtime == self._user_data_mtime:
+            return self._user_data_cache
 
-        with open(self.user_path, "r", encoding='utf-8') as user_file:
-            user_data = json.load(user_file)
+        with open(self.user_path, "rb") as user_file:
+            self._user_data_cache = _json_loads(user_file.read())
+        self._user_data_mtime = mtime
 
-        return user_data
+        return self._user_data_cache
 
-    def generate_code_verifier(self) -> bytes:
-        code_verifier = secrets.token_bytes(32)
-        code_verifier = base64.urlsafe_b64encode(code_verifier).rstrip(b"=")
+    @classmethod
+    def generate_pkce(cls) -> tuple:
+        """Return a PKCE code verifier and its S256 challenge, both as str"""
+        code_verifier = urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b"=").decode("ascii")
         logger.info("Generated code_verifier: %s", code_verifier)
-        return code_verifier
-
-    def generate_challange(self, code_verifier: bytes) -> bytes:
-        challenge_hash = hashlib.sha256(code_verifier)
-        challenge = base64.urlsafe_b64encode(challenge_hash.digest()).rstrip(b"=")
+        challenge = cls.generate_challange(code_verifier)
+        return code_verifier, challenge
+
+    @staticmethod
+    def generate_challange(code_verifier: str) -> str:
+        """Return BASE64URL(SHA256(ASCII(code_verifier))) as defined by RFC 7636"""
+        challenge_hash = sha256(code_verifier.encode("ascii"))
+        challenge = urlsafe_b64encode(challenge_hash.digest()).rstrip(b"=").decode("ascii")
         logger.info("Generated challange: %s", challenge)
         return challenge
 
     def generate_device_serial(self) -> str:
-        serial = uuid.UUID(int=uuid.getnode()).hex.upper()
+        serial = get_device_serial()
         logger.info("Generated serial: %s", serial)
         return serial
 
@@ -211,47 +369,34 @@ class AmazonService(OnlineService):
     def register_device(self, code):
         """Register current device and return the user data"""
         logger.info("Registerring a device. ID: %s", self.client_id)
-        data = {
-            "auth_data": {
-                "authorization_code": code,
-                "client_domain": "DeviceLegacy",
-                "client_id": self.client_id,
-                "code_algorithm": "SHA-256",
-                "code_verifier": self.verifier.decode("utf-8"),
-                "use_global_authentication": False,
-            },
-            "registration_data": {
-                "app_name": "AGSLauncher for Windows",
-                "app_version": "1.0.0",
-                "device_model": "Windows",
-                "device_name": None,
-                "device_serial": self.serial,
-                "device_type": "A2UMVHOX7UP4V7",
-                "domain": "Device",
-                "os_version": "10.0.19044.0",
-            },
-            "requested_extensions": ["customer_info", "device_info"],
-            "requested_token_type": ["bearer", "mac_dms"],
-            "user_context_map": {},
-        }
+        data = dict(self.device_registration_data)
+        data["auth_data"] = dict(
+            data["auth_data"],
+            authorization_code=code,
+            client_id=self.client_id,
+            code_verifier=self.verifier,
+        )
+        data["registration_data"] = dict(data["registration_data"], device_serial=self.serial)
 
         url = f"{self.amazon_api}/auth/register"
-        request = Request(url)
 
         try:
-            request.post(json.dumps(data).encode())
+            response = self.api_request(
+                "POST", url, headers={"Content-Type": "application/json"}, data=_json_dumps(data)
+            )
         except HTTPError as ex:
             logger.error("Failed http request %s", url)
             raise AuthenticationError(_("Unable to register device, please log in again")) from ex
 
-        res_json = request.json
+        res_json = _response_json(response)
         logger.info("Succesfully registered a device")
         user_data = res_json["response"]["success"]
         return user_data
 
-    def is_token_expired(self):
+    def is_token_expired(self, user_data=None):
         """Check if the stored token is expired"""
-        user_data = self.load_user_data()
+        if user_data is None:
+            user_data = self.load_user_data()
 
         token_obtain_time = user_data["token_obtain_time"]
         expires_in = user_data["tokens"]["bearer"]["expires_in"]
@@ -261,17 +406,17 @@ class AmazonService(OnlineService):
 
         return time.time() > token_obtain_time + int(expires_in)
 
-    def refresh_token(self):
-        """Refresh the token"""
+    def refresh_token(self, user_data=None):
+        """Refresh the token, user_data is updated in place"""
         url = f"{self.amazon_api}/auth/token"
         logger.info("Refreshing token")
 
-        user_data = self.load_user_data()
+        if user_data is None:
+            user_data = self.load_user_data()
 
         headers = {
             "Accept": "application/json",
             "Accept-Language": "en_US",
-            "User-Agent": self.user_agent,
             "Content-Type": "application/json",
             "charset": "utf-8",
         }
@@ -285,15 +430,13 @@ class AmazonService(OnlineService):
             "app_version": "1.0.0",
         }
 
-        request = Request(url, headers=headers)
-
         try:
-            request.post(json.dumps(request_data).encode())
+            response = self.api_request("POST", url, headers=headers, data=_json_dumps(request_data))
         except HTTPError as ex:
             logger.error("Failed http request %s", url)
             raise AuthenticationError(_("Unable to refresh token, please log in again")) from ex
 
-        res_json = request.json
+        res_json = _response_json(response)
 
         user_data["tokens"]["bearer"]["access_token"] = res_json["access_token"]
         user_data["tokens"]["bearer"]["expires_in"] = res_json["expires_in"]
@@ -301,12 +444,14 @@ class AmazonService(OnlineService):
 
         self.save_user_data(user_data)
 
-    def get_access_token(self):
+    def get_access_token(self, user_data=None):
         """Return the access token and refresh the session if required"""
-        if self.is_token_expired():
-            self.refresh_token()
+        if user_data is None:
+            user_data = self.load_user_data()
+
+        if self.is_token_expired(user_data):
+            self.refresh_token(user_data)
 
-        user_data = self.load_user_data()
         access_token = user_data["tokens"]["bearer"]["access_token"]
 
         return access_token
@@ -322,15 +467,13 @@ class AmazonService(OnlineService):
         headers = {
             "Accept": "application/json",
             "Accept-Language": "en_US",
-            "User-Agent": self.user_agent,
             "Authorization": f"bearer {access_token}",
         }
 
         url = f"{self.amazon_api}/user/profile"
-        request = Request(url, headers=headers)
 
         try:
-            request.get()
+            self.api_request("GET", url, headers=headers)
         except HTTPError:
             # Do not raise exception here, should be managed from the caller
             logger.error("Failed http request %s", url)
@@ -342,44 +485,99 @@ class AmazonService(OnlineService):
         """Return the user's library of Amazon games"""
         if system.path_exists(self.cache_path):
             logger.debug("Returning cached Amazon library")
-            with open(self.cache_path, "r", encoding='utf-8') as amazon_cache:
-                return json.load(amazon_cache)
-
-        access_token = self.get_access_token()
+            return self.read_library_cache()
 
         user_data = self.load_user_data()
+        access_token = self.get_access_token(user_data)
         serial = user_data["extensions"]["device_info"]["device_serial_number"]
 
-        games = []
-        nextToken = None
-        while True:
-            request_data = self.get_sync_request_data(serial, nextToken)
-
-            json_data = self.request_sds(
-                "com.amazonaws.gearbox."
-                "softwaredistribution.service.model."
-                "SoftwareDistributionService.GetEntitlementsV2",
-                access_token,
-                request_data,
-            )
-
-            if not json_data:
-                return
-
-            games.extend(json_data["entitlements"])
+        # The library is streamed to a temporary file which only replaces the
+        # cache once complete, a failed sync never leaves a truncated cache.
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as amazon_cache:
+                fetched = self.stream_library(amazon_cache, access_token, serial)
+        except Exception:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
 
-            if "nextToken" not in json_data:
-                break
+        if not fetched:
+            os.remove(tmp_path)
+            return
 
-            logger.info("Got next token in response, making next request")
-            nextToken = json_data["nextToken"]
+        os.replace(tmp_path, self.cache_path)
+
+        self._library_cache = None
+        return self.read_library_cache()
+
+    def read_library_cache(self):
+        """Return the library stored in the cache file, the parsed content is
+        kept in memory for as long as the file isn't modified"""
+        cache_stat = os.stat(self.cache_path)
+        if self._library_cache is not None and cache_stat.st_mtime == self._library_cache_mtime:
+            return self._library_cache
+
+        with open(self.cache_path, "rb") as amazon_cache:
+            # orjson can parse straight from a memory map, which avoids copying
+            # large caches into a bytes object first
+            if orjson and cache_stat.st_size >= MMAP_MIN_SIZE:
+                with mmap.mmap(amazon_cache.fileno(), 0, prot=mmap.PROT_READ) as cache_map:
+                    with memoryview(cache_map) as cache_view:
+                        self._library_cache = orjson.loads(cache_view)
+            else:
+                self._library_cache = _json_loads(amazon_cache.read())
+        self._library_cache_mtime = cache_stat.st_mtime
+        return self._library_cache
+
+    def stream_library(self, cache_file, access_token, serial):
+        """Write the user's entitlements to cache_file as a JSON list, one page
+        at a time, so the whole library is never held in memory.
+        Return False if a page could not be fetched."""
+        cache_file.write(b"[")
+        first = True
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.request_entitlements, access_token, serial)
+            while future:
+                json_data = future.result()
+                if not json_data:
+                    return False
+
+                # Pages are chained by their token, so the next one is requested
+                # before writing this one to overlap the round-trip with the write.
+                if "nextToken" in json_data:
+                    logger.info("Got next token in response, making next request")
+                    future = executor.submit(self.request_entitlements, access_token, serial, json_data["nextToken"])
+                else:
+                    future = None
+
+                for entitlement in json_data["entitlements"]:
+                    if not first:
+                        cache_file.write(b",")
+                    cache_file.write(_json_dumps(entitlement))
+                    first = False
+
+        cache_file.write(b"]")
+        return True
 
-        with open(self.cache_path, "w", encoding='utf-8') as amazon_cache:
-            json.dump(games, amazon_cache)
+    def request_entitlements(self, access_token, serial, nextToken=None):
+        """Return a page of the user's entitlements"""
+        request_data = self.get_sync_request_data(serial, nextToken)
 
-        return games
+        return self.request_sds(
+            "com.amazonaws.gearbox."
+            "softwaredistribution.service.model."
+            "SoftwareDistributionService.GetEntitlementsV2",
+            access_token,
+            request_data,
+        )
 
     def get_sync_request_data(self, serial, nextToken=None):
+        hardware_hash = self._hardware_hash_cache.get(serial)
+        if hardware_hash is None:
+            hardware_hash = sha256(serial.encode()).hexdigest().upper()
+            self._hardware_hash_cache[serial] = hardware_hash
+
         request_data = {
             "Operation": "GetEntitlementsV2",
             "clientId": "Sonic",
@@ -388,7 +586,7 @@ class AmazonService(OnlineService):
             "maxResults": 50,
             "productIdFilter": None,
             "keyId": "d5dc8b8b-86c8-4fc4-ae93-18c0def5314d",
-            "hardwareHash": hashlib.sha256(serial.encode()).hexdigest().upper(),
+            "hardwareHash": hardware_hash,
         }
 
         return request_data
@@ -397,23 +595,30 @@ class AmazonService(OnlineService):
         headers = {
             "X-Amz-Target": target,
             "x-amzn-token": token,
-            "User-Agent": self.user_agent,
             "UserAgent": self.user_agent,
             "Content-Type": "application/json",
             "Content-Encoding": "amz-1.0",
         }
 
         url = f"{self.amazon_sds}/amazon/"
-        request = Request(url, headers=headers)
 
         try:
-            request.post(json.dumps(body).encode())
+            response = self.api_request("POST", url, headers=headers, data=_json_dumps(body))
         except HTTPError:
             # Do not raise exception here, should be managed from the caller
             logger.error("Failed http request %s", url)
             return
 
-        return request.json
+        return _response_json(response)
+
+    def api_request(self, method, url, headers=None, data=None):
+        """Send a request through the shared session, raise HTTPError on failure"""
+        try:
+            response = self.session.request(method, url, headers=headers, data=data, timeout=DEFAULT_TIMEOUT)
+            response.raise_for_status()
+        except requests.RequestException as ex:
+            raise HTTPError(str(ex), code=getattr(ex.response, "status_code", None)) from ex
+        return response
 
     def get_game_manifest_info(self, game_id):
         """Get a game manifest information"""
@@ -633,11 +838,13 @@ class AmazonService(OnlineService):
         game_cmd, game_args = self.get_game_cmd_line(fuel_url)
         logger.info("game cmd line: %s %s", game_cmd, game_args)
 
+        title = details["product"]["title"]
+        slug = slugify(title)
         return {
-            "name": details["product"]["title"],
+            "name": title,
             "version": _("Amazon Prime Gaming"),
-            "slug": slugify(details["product"]["title"]),
-            "game_slug": slugify(details["product"]["title"]),
+            "slug": slug,
+            "game_slug": slug,
             "runner": "wine",
             "script": {
                 "game": {
@@ -151,12 +151,12 @@ class Request:
 
     @property
     def json(self):
-        _raw_json = self.text
-        if _raw_json:
+        if self.content:
             try:
-                return json.loads(_raw_json)
+                # json.loads accepts bytes, no need to decode the content to str first
+                return json.loads(self.content)
             except json.decoder.JSONDecodeError as err:
-                raise ValueError(f"JSON response from {self.url} could not be decoded: '{_raw_json[:80]}'") from err
+                raise ValueError(f"JSON response from {self.url} could not be decoded: '{self.text[:80]}'") from err
         return {}
 
     @property
@@ -0,0 +1,84 @@
+from unittest import TestCase
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from lutris.services.amazon import AmazonService, get_auth_code
+
+
+class TestAmazonPKCE(TestCase):
+    def test_challenge_matches_rfc_7636_example(self):
+        verifier = "dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk"
+        self.assertEqual(
+            AmazonService.generate_challange(verifier),
+            "E9Melhoa2OwvFrEMTJguCHaoeK1t8URWbuGJSstw-cM"
+        )
+
+    def test_generated_verifier_and_challenge(self):
+        verifier, challenge = AmazonService.generate_pkce()
+        self.assertIsInstance(verifier, str)
+        self.assertEqual(len(verifier), 43)
+        self.assertEqual(challenge, AmazonService.generate_challange(verifier))
+
+
+class TestAmazonAuthCode(TestCase):
+    @staticmethod
+    def parse_qs_auth_code(url):
+        return parse_qs(urlparse(url).query)["openid.oa2.authorization_code"][0]
+
+    def test_encoded_code_matches_parse_qs(self):
+        for url in (
+            "https://www.amazon.com/?openid.assoc_handle=amzn_sonic_games_launcher"
+            "&openid.oa2.authorization_code=ANab%2Fcd%3D%3D&openid.mode=id_res",
+            "https://www.amazon.com/?openid.oa2.authorization_code=AN+abcd",
+        ):
+            self.assertEqual(get_auth_code(url), self.parse_qs_auth_code(url))
+        self.assertEqual(get_auth_code("https://www.amazon.com/?openid.oa2.authorization_code=AN+abcd"), "AN abcd")
+
+    def test_code_ends_at_next_parameter_or_fragment(self):
+        self.assertEqual(
+            get_auth_code("https://www.amazon.com/?openid.oa2.authorization_code=ANabcd&openid.mode=id_res"),
+            "ANabcd"
+        )
+        self.assertEqual(
+            get_auth_code("https://www.amazon.com/?openid.oa2.authorization_code=ANabcd#signin"),
+            "ANabcd"
+        )
+
+    def test_url_without_code(self):
+        self.assertIsNone(get_auth_code("https://www.amazon.com/?openid.mode=cancel"))
+        self.assertIsNone(get_auth_code("https://www.amazon.com/ap/signin"))
+
+
+class TestAmazonLoginURL(TestCase):
+    serial = "0000000000000000000000AABBCCDDEE"
+    # Hex encoding of "<serial>#A2UMVHOX7UP4V7"
+    client_id = (
+        "30303030303030303030303030303030303030303030"
+        "41414242434344444545234132554d56484f58375550345637"
+    )
+    challenge = "E9Melhoa2OwvFrEMTJguCHaoeK1t8URWbuGJSstw-cM"
+
+    @patch.object(AmazonService, "generate_device_serial", return_value=serial)
+    @patch.object(AmazonService, "generate_pkce", return_value=("verifier", challenge))
+    def test_login_url_matches_urlencode(self, _pkce, _serial):
+        service = AmazonService()
+        login_url = service.login_url
+        arguments = {
+            "openid.ns": "http://specs.openid.net/auth/2.0",
+            "openid.claimed_id": "http://specs.openid.net/auth/2.0/identifier_select",
+            "openid.identity": "http://specs.openid.net/auth/2.0/identifier_select",
+            "openid.mode": "checkid_setup",
+            "openid.oa2.scope": "device_auth_access",
+            "openid.ns.oa2": "http://www.amazon.com/ap/ext/oauth/2",
+            "openid.oa2.response_type": "code",
+            "openid.oa2.code_challenge_method": "S256",
+            "openid.oa2.client_id": f"device:{self.client_id}",
+            "language": "en_US",
+            "marketPlaceId": "ATVPDKIKX0DER",
+            "openid.return_to": "https://www.amazon.com",
+            "openid.pape.max_auth_age": 0,
+            "openid.assoc_handle": "amzn_sonic_games_launcher",
+            "pageId": "amzn_sonic_games_launcher",
+            "openid.oa2.code_challenge": self.challenge,
+        }
+        self.assertEqual(login_url, "https://amazon.com/ap/signin?" + urlencode(arguments))